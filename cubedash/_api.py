@@ -7,7 +7,6 @@ from cubedash import _utils
 
 from . import _model
 from ._utils import as_geojson
-from .summary import ItemSort
 
 _LOG = logging.getLogger(__name__)
 bp = Blueprint("api", __name__, url_prefix="/api")
@@ -31,19 +30,11 @@ def datasets_geojson(
 
     time = _utils.as_time_range(year, month, day, tzinfo=_model.STORE.grouping_timezone)
 
-    return as_geojson(
-        dict(
-            type="FeatureCollection",
-            features=[
-                s.as_geojson()
-                for s in _model.STORE.search_items(
-                    product_names=[product_name],
-                    time=time,
-                    limit=limit,
-                    order=ItemSort.UNSORTED,
-                )
-                if s.geom_geojson is not None
-            ],
+    return _utils.as_geojson_feature_collection(
+        _model.STORE.search_items_geojson(
+            product_names=[product_name],
+            time=time,
+            limit=limit,
         ),
         downloadable_filename_prefix=_utils.api_path_as_filename_prefix(),
     )
@@ -69,10 +60,14 @@ def datasets_geojson(
 def footprint_geojson(
     product_name: str, year: int = None, month: int = None, day: int = None
 ):
-    return as_geojson(
-        _model.get_footprint_geojson(product_name, year, month, day),
-        downloadable_filename_prefix=_utils.api_path_as_filename_prefix(),
+    footprint = _model.get_footprint_geojson_bytes(
+        product_name, year, month, day, formatted=_utils.prefers_formatted_json()
     )
+    if footprint is None:
+        return as_geojson(
+            None, downloadable_filename_prefix=_utils.api_path_as_filename_prefix()
+        )
+    return _as_tagged_geojson(footprint)
 
 
 @bp.route("/regions/<product_name>")
@@ -82,9 +77,26 @@ def footprint_geojson(
 def regions_geojson(
     product_name: str, year: int = None, month: int = None, day: int = None
 ):
-    regions = _model.get_regions_geojson(product_name, year, month, day)
+    regions = _model.get_regions_geojson_bytes(
+        product_name, year, month, day, formatted=_utils.prefers_formatted_json()
+    )
     if regions is None:
         abort(404, f"{product_name} does not have regions")
-    return as_geojson(
-        regions, downloadable_filename_prefix=_utils.api_path_as_filename_prefix()
+    return _as_tagged_geojson(regions)
+
+
+def _as_tagged_geojson(serialised: _model.SerialisedJson) -> flask.Response:
+    """
+    Respond with the cached body and its cached ETag, so that a browser
+    revisiting an unchanged summary gets an empty 304 rather than the whole
+    body again.
+    """
+    response = as_geojson(
+        serialised.body,
+        downloadable_filename_prefix=_utils.api_path_as_filename_prefix(),
     )
+    response.set_etag(serialised.etag)
+    # Summaries change whenever they're regenerated, so clients should always
+    # revalidate (which is cheap, with the ETag) rather than reuse it blindly.
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
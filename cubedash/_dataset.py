@@ -59,8 +59,20 @@ def dataset_full_page(product_name: str, id_: UUID):
         source_dataset_overflow = len(source_list) - PROVENANCE_DISPLAY_LIMIT
         source_list = source_list[:PROVENANCE_DISPLAY_LIMIT]
 
+    # All sources in one query, rather than a round-trip for each.
+    datasets_by_id = (
+        {
+            d.id: d
+            for d in index.datasets.bulk_get(
+                dataset_d["id"] for _, dataset_d in source_list
+            )
+        }
+        if source_list
+        else {}
+    )
     source_datasets = {
-        type_: index.datasets.get(dataset_d["id"]) for type_, dataset_d in source_list
+        type_: datasets_by_id.get(UUID(str(dataset_d["id"])))
+        for type_, dataset_d in source_list
     }
 
     archived_location_times = index.datasets.get_archived_location_times(id_)
@@ -53,6 +53,9 @@ def _dataset_label(dataset):
 
 @bp.app_template_filter("torapidjson")
 def _fast_tojson(obj):
+    # Already-serialised json (such as from a cache) is included as-is.
+    if isinstance(obj, bytes):
+        return Markup(obj.decode("utf-8"))
     return Markup(orjson.dumps(obj).decode("utf-8"))
 
 
@@ -1,8 +1,9 @@
+import hashlib
 import json
 import os
 import time
 from pathlib import Path
-from typing import Counter, Dict, List, Optional, Tuple
+from typing import Counter, Dict, List, NamedTuple, Optional, Tuple
 
 import flask
 import structlog
@@ -17,6 +18,7 @@ from shapely.geometry import MultiPolygon
 # from https://stackoverflow.com/questions/23347387/x-forwarded-proto-and-flask
 from werkzeug.middleware.proxy_fix import ProxyFix
 
+from cubedash import _utils
 from cubedash.summary import SummaryStore, TimePeriodOverview
 from cubedash.summary._extents import RegionInfo
 from cubedash.summary._stores import ProductSummary
@@ -137,7 +139,6 @@ def get_products_with_summaries() -> List[ProductWithSummary]:
     ]
 
 
-@cache.memoize(timeout=60)
 def get_footprint_geojson(
     product_name: str,
     year: Optional[int] = None,
@@ -163,7 +164,6 @@ def get_footprint_geojson(
     )
 
 
-@cache.memoize(timeout=60)
 def get_regions_geojson(
     product_name: str,
     year: Optional[int] = None,
@@ -201,6 +201,54 @@ def get_regions_geojson(
     return regions
 
 
+class SerialisedJson(NamedTuple):
+    body: bytes
+    # A digest of the body, for use as an http ETag.
+    etag: str
+
+    @classmethod
+    def of(cls, o, formatted: bool = False) -> "SerialisedJson":
+        body = _utils.to_json_bytes(o, formatted=formatted)
+        return cls(body, hashlib.blake2b(body, digest_size=8).hexdigest())
+
+
+@cache.memoize(timeout=60)
+def get_footprint_geojson_bytes(
+    product_name: str,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    day: Optional[int] = None,
+    formatted: bool = False,
+) -> Optional[SerialisedJson]:
+    """
+    The footprint geojson, already serialised. None if there's no footprint.
+
+    (Only this serialised form is cached, so that responses don't re-serialise
+    or re-hash it on every hit, and we don't hold a second copy as a dict)
+    """
+    footprint = get_footprint_geojson(product_name, year, month, day)
+    if footprint is None:
+        return None
+    return SerialisedJson.of(footprint, formatted=formatted)
+
+
+@cache.memoize(timeout=60)
+def get_regions_geojson_bytes(
+    product_name: str,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    day: Optional[int] = None,
+    formatted: bool = False,
+) -> Optional[SerialisedJson]:
+    """
+    The regions geojson, already serialised. None if the product has no regions.
+    """
+    regions = get_regions_geojson(product_name, year, month, day)
+    if regions is None:
+        return None
+    return SerialisedJson.of(regions, formatted=formatted)
+
+
 def _get_footprint(period: TimePeriodOverview) -> Optional[MultiPolygon]:
     if not period or not period.dataset_count:
         return None
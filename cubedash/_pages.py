@@ -9,7 +9,6 @@ import structlog
 from datacube.model import DatasetType, Range
 from datacube.scripts.dataset import build_dataset_info
 from flask import abort, redirect, request, url_for
-from werkzeug.datastructures import MultiDict
 
 import cubedash
 from cubedash import _audit, _monitoring
@@ -89,7 +88,11 @@ def product_page(
     default_zoom = flask.current_app.config["default_map_zoom"]
     default_center = flask.current_app.config["default_map_center"]
 
-    region_geojson = _model.get_regions_geojson(product_name, year, month, day)
+    # Included in the page pre-serialised, as they're cached that way for the API too.
+    region_geojson = _model.get_regions_geojson_bytes(product_name, year, month, day)
+    footprint_geojson = _model.get_footprint_geojson_bytes(
+        product_name, year, month, day
+    )
 
     return utils.render(
         "product.html",
@@ -97,9 +100,9 @@ def product_page(
         month=month,
         day=day,
         # Which data to preload with the page?
-        regions_geojson=region_geojson,
+        regions_geojson=region_geojson.body if region_geojson else None,
         datasets_geojson=None,  # _model.get_datasets_geojson(product_name, year, month, day),
-        footprint_geojson=_model.get_footprint_geojson(product_name, year, month, day),
+        footprint_geojson=footprint_geojson.body if footprint_geojson else None,
         product=product,
         product_region_info=_model.STORE.get_product_region_info(product_name)
         if region_geojson
@@ -157,12 +160,10 @@ def search_page(
         year, month, day, tzinfo=_model.STORE.grouping_timezone
     )
 
-    args = MultiDict(flask.request.args)
-    query = utils.query_to_search(args, product=product)
-
-    # Always add time range, selected product to query
-    if product_name:
-        query["product"] = product_name
+    # (query_to_search only reads the args, so there's no need to copy them)
+    query = utils.query_to_search(flask.request.args, product=product)
+    # The product always comes from the url, not the args.
+    query.pop("product", None)
 
     if "time" in query:
         # If they left one end of the range open, fill it in with the product bounds.
@@ -177,12 +178,10 @@ def search_page(
     if time_range:
         query["time"] = time_range
 
-    _LOG.info("query", query=query)
+    _LOG.info("query", product=product.name, query=query)
 
-    # TODO: Add sort option to index API
-    datasets = sorted(
-        _model.STORE.index.datasets.search(**query, limit=_HARD_SEARCH_LIMIT + 1),
-        key=lambda d: d.center_time,
+    datasets = list(
+        _model.STORE.find_datasets(product, query, limit=_HARD_SEARCH_LIMIT + 1)
     )
     more_datasets_exist = False
     if len(datasets) > _HARD_SEARCH_LIMIT:
@@ -433,8 +432,8 @@ def inject_globals():
         # Only the known, summarised products in groups.
         grouped_products=_get_grouped_products(),
         # All products in the datacube, summarised or not.
-        datacube_products=list(_model.STORE.index.products.get_all()),
-        datacube_metadata_types=list(_model.STORE.index.metadata_types.get_all()),
+        datacube_products=_model.STORE.all_dataset_types(),
+        datacube_metadata_types=_model.STORE.all_metadata_types(),
         current_time=datetime.utcnow(),
         datacube_version=datacube.__version__,
         app_version=cubedash.__version__,
@@ -131,11 +131,7 @@ def metadata_type_page(name):
     ordered_metadata = utils.prepare_document_formatting(metadata_type.definition)
 
     products_using_it = sorted(
-        (
-            p
-            for p in _model.STORE.index.products.get_all()
-            if p.metadata_type.name == name
-        ),
+        (p for p in _model.STORE.all_dataset_types() if p.metadata_type.name == name),
         key=lambda p: p.name,
     )
     return utils.render(
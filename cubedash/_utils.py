@@ -6,21 +6,28 @@ Common global filters and util methods.
 import csv
 import difflib
 import functools
+import hashlib
 import io
 import re
 from collections import defaultdict
 from datetime import datetime, timedelta
+from decimal import Decimal
 from io import StringIO
+from threading import Lock
 from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 from urllib.parse import urljoin, urlparse
+from uuid import UUID
 
 import datacube.drivers.postgres._schema
 import eodatasets3.serialise
 import flask
+import numpy
 import shapely.geometry
 import shapely.validation
 import structlog
 from affine import Affine
+from cachetools import LRUCache, cached
+from cachetools.keys import hashkey
 from datacube import utils as dc_utils
 from datacube.drivers.postgres import _api as pgapi
 from datacube.drivers.postgres._fields import PgDocField
@@ -28,7 +35,7 @@ from datacube.index import Index
 from datacube.index.eo3 import is_doc_eo3
 from datacube.index.fields import Field
 from datacube.model import Dataset, DatasetType, MetadataType, Range
-from datacube.utils import geometry, jsonify_document
+from datacube.utils import geometry
 from datacube.utils.geometry import CRS
 from dateutil import tz
 from dateutil.relativedelta import relativedelta
@@ -41,7 +48,8 @@ from shapely.geometry import Polygon, shape
 from sqlalchemy.engine import Engine
 from werkzeug.datastructures import MultiDict
 
-_TARGET_CRS = "EPSG:4326"
+# One shared CRS object (and so shared proj transformers) for all our reprojection.
+WGS84_CRS = CRS("EPSG:4326")
 
 DEFAULT_PLATFORM_END_DATE = {
     "LANDSAT_8": datetime.now() - relativedelta(months=2),
@@ -385,34 +393,58 @@ def dataset_created(dataset: Dataset) -> Optional[datetime]:
 
 def as_rich_json(o):
     """
-    Use datacube's method of simplifying objects before serialising to json
+    Serialise datacube models and documents to json
 
-    (Primarily useful for serialising datacube models reliably)
+    (Handles the extra types that turn up in datacube's documents, such as
+     Decimals, numpy values and non-string keys, which plain as_json() rejects)
 
-    Much slower than as_json()
+    These are handled in orjson's fallback as they're encountered, rather than
+    walking and copying the whole document beforehand.
     """
-    return as_json(jsonify_document(o))
+    return as_json(
+        o, extra_options=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
 
 
-def as_json(o, content_type="application/json") -> flask.Response:
+def prefers_formatted_json() -> bool:
     # Indent if they're loading directly in a browser.
     #   (Flask's Accept parsing is too smart, and sees html-acceptance in
     #    default ajax requests "accept: */*". So we do it raw.)
-    prefer_formatted = "text/html" in flask.request.headers.get("Accept", ())
-
-    return flask.Response(
-        orjson.dumps(
-            o,
-            option=orjson.OPT_INDENT_2 if prefer_formatted else 0,
-            default=_json_fallback,
-        ),
-        content_type=content_type,
-    )
+    return "text/html" in flask.request.headers.get("Accept", ())
+
+
+def to_json_bytes(o, formatted: bool = False, extra_options: int = 0) -> bytes:
+    option = extra_options
+    if formatted:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(o, option=option, default=_json_fallback)
+
+
+def as_json(
+    o: Union[object, bytes], content_type="application/json", extra_options=0
+) -> flask.Response:
+    """
+    Serialise the given object into a json flask response.
+
+    Bytes are assumed to be already-serialised json (such as from a cache),
+    and are returned as-is.
+    """
+    if not isinstance(o, bytes):
+        o = to_json_bytes(o, prefers_formatted_json(), extra_options)
+    return flask.Response(o, content_type=content_type)
 
 
 def _json_fallback(o, *args, **kwargs):
-    if isinstance(o, (geometry.BoundingBox, Affine)):
-        return tuple(o)
+    # Namedtuples (such as datacube's Range and BoundingBox), which orjson
+    # won't serialise itself.
+    if isinstance(o, (tuple, Affine)):
+        return list(o)
+
+    # Matching datacube's jsonify_document() conversions.
+    if isinstance(o, Decimal):
+        return str(o)
+    if isinstance(o, numpy.dtype):
+        return o.name
 
     # I think orjson swallows our nicer error message?
     raise TypeError(
@@ -435,6 +467,48 @@ def as_geojson(o, downloadable_filename_prefix: str = None):
     return response
 
 
+def as_geojson_feature_collection(
+    features: Iterable[str], downloadable_filename_prefix: str = None
+):
+    """
+    Stream the given already-serialised features as a GeoJSON
+    FeatureCollection flask response.
+
+    Each feature is written out as it's produced, so the response starts
+    immediately and the whole collection is never held in memory at once.
+    """
+    # A browser showing it to a human wants it formatted, which we only do whole.
+    if prefers_formatted_json():
+        return as_geojson(
+            dict(
+                type="FeatureCollection",
+                features=[orjson.loads(feature) for feature in features],
+            ),
+            downloadable_filename_prefix=downloadable_filename_prefix,
+        )
+
+    # Start the query (and so raise any of its errors) before responding: once
+    # the response has started it's a 200, and can only be truncated.
+    features = iter(features)
+    first_feature = next(features, None)
+
+    def _serialised_collection():
+        yield b'{"type":"FeatureCollection","features":['
+        if first_feature is not None:
+            yield first_feature.encode("utf-8")
+            for feature in features:
+                yield b","
+                yield feature.encode("utf-8")
+        yield b"]}"
+
+    response = flask.Response(
+        _serialised_collection(), content_type="application/geo+json"
+    )
+    if downloadable_filename_prefix:
+        suggest_download_filename(response, downloadable_filename_prefix, ".geojson")
+    return response
+
+
 def common_uri_prefix(uris: Sequence[str]):
     """
     This is like `os.path.commonpath()`, but always expects URL paths.
@@ -739,12 +813,22 @@ EODATASETS_LINEAGE_PROPERTY_ORDER = [
 ]
 
 
+def geometry_digest(wkb: Union[bytes, memoryview, str]) -> bytes:
+    """
+    A short digest of a (WKB) geometry.
+
+    For caching by geometry, without keeping whole geometries as cache keys.
+    """
+    if isinstance(wkb, str):
+        wkb = wkb.encode("ascii")
+    return hashlib.blake2b(wkb, digest_size=16).digest()
+
+
 def dataset_shape(ds: Dataset) -> Tuple[Optional[Polygon], bool]:
     """
     Get a usable extent from the dataset (if possible), and return
     whether the original was valid.
     """
-    log = _LOG.bind(dataset_id=ds.id)
     try:
         extent = ds.extent
     except AttributeError:
@@ -753,9 +837,31 @@ def dataset_shape(ds: Dataset) -> Tuple[Optional[Polygon], bool]:
         return None, False
 
     if extent is None:
-        log.warn("invalid_dataset.empty_extent")
+        _LOG.warn("invalid_dataset.empty_extent", dataset_id=ds.id)
         return None, False
-    geom = shapely.geometry.asShape(extent.to_crs(CRS(_TARGET_CRS)))
+
+    return _extent_shape(ds.id, extent)
+
+
+@cached(
+    LRUCache(maxsize=1_000),
+    key=lambda dataset_id, extent: hashkey(
+        str(extent.crs), geometry_digest(extent.geom.wkb)
+    ),
+    lock=Lock(),
+)
+def _extent_shape(
+    dataset_id: UUID, extent: geometry.Geometry
+) -> Tuple[Optional[Polygon], bool]:
+    """
+    Reproject and clean a dataset extent.
+
+    (Cached by the extent's content, so a changed extent is recalculated)
+    """
+    log = _LOG.bind(dataset_id=dataset_id)
+    # The reprojected Geometry already holds a shapely geometry: use it directly,
+    # rather than rebuilding one via the (legacy, slow) asShape adapter.
+    geom = extent.to_crs(WGS84_CRS).geom
 
     if not geom.is_valid:
         log.warn(
@@ -767,12 +873,12 @@ def dataset_shape(ds: Dataset) -> Tuple[Optional[Polygon], bool]:
         assert clean.geom_type in (
             "Polygon",
             "MultiPolygon",
-        ), f"got {clean.geom_type} for cleaned {ds.id}"
+        ), f"got {clean.geom_type} for cleaned {dataset_id}"
         assert clean.is_valid
         return clean, False
 
     if geom.is_empty:
-        _LOG.warn("invalid_dataset.empty_extent_geom", dataset_id=ds.id)
+        log.warn("invalid_dataset.empty_extent_geom")
         return None, False
 
     return geom, True
@@ -7,11 +7,12 @@ It will use your default datacube settings
 as DATACUBE_ENVIRONMENT)
 
 """
+import os
+from importlib.util import find_spec
 from textwrap import dedent
 
 import click
 from click import style
-from werkzeug.serving import run_simple
 
 class ReverseProxied(object):
 
@@ -38,6 +39,45 @@ class ReverseProxied(object):
 
 
 
+def _load_app(debug_mode: bool):
+    from cubedash import app
+
+    # Fixing url when service behind reverse proxy
+    # Source: https://blog.macuyiko.com/post/2016/fixing-flask-url_for-when-behind-mod_proxy.html
+    script_name = os.getenv("PROXY_PATH", "/")
+    if script_name != "/":
+        app.wsgi_app = ReverseProxied(app.wsgi_app, script_name=script_name)
+
+    if debug_mode:
+        app.debug = True
+    return app
+
+
+def _run_gunicorn(hostname: str, port: int, workers: int):
+    """
+    Serve with pre-forked gunicorn workers (with the same worker settings
+    and config module as our Dockerfile)
+    """
+    from gunicorn.app.base import BaseApplication
+
+    from cubedash import gunicorn_config
+
+    class _ExplorerApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{hostname}:{port}")
+            self.cfg.set("workers", workers)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("threads", 2)
+            self.cfg.set("timeout", 60)
+            # Clean up dead workers' Prometheus metrics.
+            self.cfg.set("child_exit", gunicorn_config.child_exit)
+
+        def load(self):
+            return _load_app(debug_mode=False)
+
+    _ExplorerApplication().run()
+
+
 def _print_version(ctx, param, value):
     """Print version information and exit"""
     if not value or ctx.resilient_parsing:
@@ -99,24 +139,26 @@ def cli(
     event_log_file: str,
     verbose: bool,
 ):
-    from cubedash import app
     from cubedash.logs import init_logging
 
-    # Fixing url when service behind reverse proxy
-    # Source: https://blog.macuyiko.com/post/2016/fixing-flask-url_for-when-behind-mod_proxy.html
-    import os
-    script_name = os.getenv("PROXY_PATH", "/")
-    if script_name != "/":
-        app.wsgi_app = ReverseProxied(app.wsgi_app, script_name=script_name)
-
-
     init_logging(
         open(event_log_file, "ab") if event_log_file else None, verbosity=verbose
     )
 
-    if debug_mode:
-        app.debug = True
-    run_simple(hostname, port, app, use_reloader=debug_mode, processes=workers)
+    # Gunicorn is optional (in our "deployment" extras), and debug mode keeps
+    # the dev server for its reloader and debugger.
+    if not debug_mode and find_spec("gunicorn") is not None:
+        _run_gunicorn(hostname, port, workers)
+    else:
+        from werkzeug.serving import run_simple
+
+        run_simple(
+            hostname,
+            port,
+            _load_app(debug_mode),
+            use_reloader=debug_mode,
+            processes=workers,
+        )
 
 
 if __name__ == '__main__':
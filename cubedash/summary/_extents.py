@@ -13,7 +13,7 @@ import shapely.ops
 import structlog
 from datacube import Datacube
 from datacube.drivers.postgres._fields import PgDocField, RangeDocField
-from datacube.index import Index
+from datacube.index import Index, fields as odc_fields
 from datacube.model import Dataset, DatasetType, Field, MetadataType, Range
 from geoalchemy2 import Geometry, WKBElement
 from geoalchemy2.shape import from_shape, to_shape
@@ -635,6 +635,34 @@ def datasets_by_region(
     )
 
 
+def datasets_by_center_time(
+    engine: Engine,
+    index: Index,
+    product: DatasetType,
+    query: Dict,
+    limit: int,
+) -> Generator[Dataset, None, None]:
+    """
+    Search a product's datasets in the ODC index, ordered by center time.
+
+    The query is a dict of the product's dataset search fields (as in ODC's
+    `index.datasets.search()`). Unlike ODC's search, the sort and limit are
+    done by Postgres, so we get the *first* datasets, not an arbitrary subset.
+    """
+    expressions = odc_fields.to_expressions(
+        product.metadata_type.dataset_fields.get, dataset_type_id=product.id, **query
+    )
+    select_query = (
+        postgres_api.PostgresDbAPI.search_datasets_query(expressions)
+        .order_by(datetime_expression(product.metadata_type), DATASET.c.id)
+        .limit(limit)
+    )
+    return (
+        index.datasets._make(res, product=product)
+        for res in engine.execute(select_query)
+    )
+
+
 @dataclass
 class RegionSummary:
     product_name: str
@@ -12,6 +12,8 @@ from datacube.utils.geometry import Geometry
 from shapely.geometry import MultiPolygon
 from shapely.geometry.base import BaseGeometry
 
+from cubedash._utils import WGS84_CRS
+
 _LOG = structlog.get_logger()
 
 
@@ -245,7 +247,7 @@ class TimePeriodOverview:
 
         return (
             Geometry(self.footprint_geometry, crs=self.footprint_crs)
-            .to_crs("EPSG:4326", wrapdateline=True)
+            .to_crs(WGS84_CRS, wrapdateline=True)
             .geom
         )
 
@@ -310,10 +312,18 @@ def _create_unified_footprint(
     if not with_valid_geometries:
         return None
 
+    # Periods of regularly-tiled products very often have identical footprints
+    # (the same tiles every month), and repeated geometries are the most expensive
+    # input for the union to node. So only union each distinct footprint once.
+    footprints = list(
+        {
+            p.footprint_geometry.wkb: p.footprint_geometry
+            for p in with_valid_geometries
+        }.values()
+    )
+
     try:
-        geometry_union = shapely.ops.unary_union(
-            [p.footprint_geometry for p in with_valid_geometries]
-        )
+        geometry_union = shapely.ops.unary_union(footprints)
     except ValueError:
         # Attempt 2 at union: Exaggerate the overlap *slightly* to
         # avoid non-noded intersection.
@@ -321,7 +331,7 @@ def _create_unified_footprint(
         try:
             _LOG.warn("summary.footprint.invalid_union", exc_info=True)
             geometry_union = shapely.ops.unary_union(
-                [p.footprint_geometry.buffer(0.001) for p in with_valid_geometries]
+                [footprint.buffer(0.001) for footprint in footprints]
             )
         except ValueError:
             _LOG.warn("summary.footprint.invalid_buffered_union", exc_info=True)
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from enum import Enum, auto
 from itertools import groupby
+from threading import Lock
 from typing import (
     Dict,
     Generator,
@@ -22,14 +23,26 @@ from uuid import UUID
 
 import dateutil.parser
 import structlog
+from cachetools import LRUCache, cached
 from cachetools.func import lru_cache, ttl_cache
+from cachetools.keys import hashkey
 from dateutil import tz
 from geoalchemy2 import WKBElement, shape as geo_shape
 from geoalchemy2.shape import from_shape, to_shape
 from shapely.geometry.base import BaseGeometry
-from sqlalchemy import DDL, String, and_, exists, func, literal, or_, select, union_all
+from sqlalchemy import (
+    DDL,
+    String,
+    and_,
+    case,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    union_all,
+)
 from sqlalchemy.dialects import postgresql as postgres
-from sqlalchemy.dialects.postgresql import TSTZRANGE
 from sqlalchemy.engine import Engine
 from sqlalchemy.sql import Select
 
@@ -41,10 +54,15 @@ from datacube import Datacube
 from datacube.drivers.postgres._fields import PgDocField
 from datacube.index import Index
 from datacube.model import Dataset, DatasetType, Range
-from datacube.utils.geometry import Geometry
+from datacube.utils.geometry import CRS, Geometry
 
 from cubedash import _utils
-from cubedash._utils import ODC_DATASET, ODC_DATASET_LOCATION, ODC_DATASET_TYPE
+from cubedash._utils import (
+    ODC_DATASET,
+    ODC_DATASET_LOCATION,
+    ODC_DATASET_TYPE,
+    WGS84_CRS,
+)
 from cubedash.summary import RegionInfo, TimePeriodOverview, _extents, _schema
 from cubedash.summary._extents import (
     ProductArrival,
@@ -1095,13 +1113,13 @@ class SummaryStore:
             query = query.where(DATASET_SPATIAL.c.id.in_(dataset_ids))
         else:
             if time:
+                # A plain (inclusive) comparison rather than a tstzrange containment,
+                # so Postgres can range-scan our (dataset_type_ref, center_time) indexes.
                 query = query.where(
-                    func.tstzrange(
+                    DATASET_SPATIAL.c.center_time.between(
                         _utils.default_utc(time[0]),
                         _utils.default_utc(time[1]),
-                        "[]",
-                        type_=TSTZRANGE,
-                    ).contains(DATASET_SPATIAL.c.center_time)
+                    )
                 )
 
             if bbox:
@@ -1298,7 +1316,7 @@ class SummaryStore:
                 dataset_id=r.id,
                 bbox=_box2d_to_bbox(r.bbox) if r.bbox else None,
                 product_name=self.index.products.get(r.dataset_type_ref).name,
-                geometry=_get_shape(r.geometry, self._get_srid_name(r.geometry.srid)),
+                geometry=_get_shape(r.geometry, self._get_srid_crs(r.geometry.srid)),
                 region_code=r.region_code,
                 creation_time=r.creation_time,
                 center_time=r.center_time,
@@ -1309,6 +1327,86 @@ class SummaryStore:
                 ),
             )
 
+    def search_items_geojson(
+        self,
+        *,
+        product_names: Optional[List[str]] = None,
+        time: Optional[Tuple[datetime, datetime]] = None,
+        bbox: Tuple[float, float, float, float] = None,
+        limit: int = 500,
+        offset: int = 0,
+    ) -> Generator[str, None, None]:
+        """
+        Search datasets using Explorer's spatial table, returning each as a
+        serialised GeoJSON Feature (in the same form as DatasetItem.as_geojson())
+
+        The Features are built and serialised by Postgis, skipping the creation
+        of Python geometries, DatasetItems and dicts for every result.
+
+        Results are unsorted.
+        """
+        items = self._add_fields_to_query(
+            select(
+                [
+                    DATASET_SPATIAL.c.id,
+                    DATASET_SPATIAL.c.dataset_type_ref,
+                    DATASET_SPATIAL.c.region_code,
+                    DATASET_SPATIAL.c.creation_time,
+                    DATASET_SPATIAL.c.center_time,
+                    func.ST_Transform(DATASET_SPATIAL.c.footprint, 4326).label(
+                        "geometry"
+                    ),
+                ]
+            ).select_from(DATASET_SPATIAL),
+            product_names=product_names,
+            time=time,
+            bbox=bbox,
+        )
+        items = items.limit(limit).offset(offset).alias("items")
+
+        # Our shapes are valid in the db, but can become invalid on
+        # reprojection. We buffer if needed (as in _get_shape()).
+        geometry = case(
+            [(func.ST_IsValid(items.c.geometry), items.c.geometry)],
+            else_=func.ST_Buffer(items.c.geometry, 0),
+        )
+        feature = func.json_build_object(
+            "id",
+            items.c.id,
+            "type",
+            "Feature",
+            "bbox",
+            func.json_build_array(
+                func.ST_XMin(items.c.geometry),
+                func.ST_YMin(items.c.geometry),
+                func.ST_XMax(items.c.geometry),
+                func.ST_YMax(items.c.geometry),
+            ),
+            "geometry",
+            func.ST_AsGeoJSON(geometry).cast(postgres.JSON),
+            "properties",
+            func.json_build_object(
+                "datetime",
+                items.c.center_time,
+                "odc:product",
+                ODC_DATASET_TYPE.c.name,
+                "odc:processing_datetime",
+                items.c.creation_time,
+                "cubedash:region_code",
+                items.c.region_code,
+            ),
+        )
+        # As text, so that it isn't parsed only to be serialised again.
+        query = select([feature.cast(String).label("feature")]).select_from(
+            items.join(
+                ODC_DATASET_TYPE, ODC_DATASET_TYPE.c.id == items.c.dataset_type_ref
+            )
+        )
+        # A server-side cursor, so that rows arrive as they're consumed, rather
+        # than the driver fetching (and holding) the whole result first.
+        for r in self._engine.execute(query.execution_options(stream_results=True)):
+            yield r.feature
+
     def _recalculate_period(
         self,
         product: ProductSummary,
@@ -1582,14 +1680,42 @@ class SummaryStore:
         """
         return get_srid_name(self._engine, srid)
 
+    @lru_cache()
+    def _get_srid_crs(self, srid: int) -> CRS:
+        """
+        Get a datacube CRS for an internal postgres srid key.
+
+        Rows with the same srid share one CRS object, rather than re-parsing
+        a CRS for every row.
+        """
+        return CRS(self._get_srid_name(srid))
+
     def list_complete_products(self) -> List[str]:
         """
         List all names of products that have summaries available.
         """
+        # One query for all names, rather than loading each product's
+        # whole (footprint-and-all) summary just to see if it exists.
+        period, start_day = TimePeriodOverview.flat_period_representation(
+            None, None, None
+        )
+        summarised_names = {
+            name
+            for (name,) in self._engine.execute(
+                select([PRODUCT.c.name])
+                .select_from(
+                    PRODUCT.join(
+                        TIME_OVERVIEW, TIME_OVERVIEW.c.product_ref == PRODUCT.c.id
+                    )
+                )
+                .where(TIME_OVERVIEW.c.period_type == period)
+                .where(TIME_OVERVIEW.c.start_day == start_day)
+            )
+        }
         return sorted(
             product.name
             for product in self.all_dataset_types()
-            if self.has(product.name, None, None, None)
+            if product.name in summarised_names
         )
 
     def find_datasets_for_region(
@@ -1616,6 +1742,18 @@ class SummaryStore:
             offset=offset,
         )
 
+    def find_datasets(
+        self, product: DatasetType, query: Dict, limit: int
+    ) -> Iterable[Dataset]:
+        """
+        Search the ODC datasets of a product, sorted by center time.
+
+        The query is a dict of dataset search fields (other than the product).
+        """
+        return _extents.datasets_by_center_time(
+            self._engine, self.index, product, query, limit
+        )
+
     @ttl_cache(ttl=DEFAULT_TTL)
     def _region_summaries(self, product_name: str) -> Dict[str, RegionSummary]:
         dt = self.get_dataset_type(product_name)
@@ -1898,7 +2036,7 @@ def _box2d_to_bbox(pg_box2d: str) -> Tuple[float, float, float, float]:
     return tuple(float(m) for m in m.groups())
 
 
-def _get_shape(geometry: WKBElement, crs) -> Optional[Geometry]:
+def _get_shape(geometry: WKBElement, crs: CRS) -> Optional[Geometry]:
     """
     Our shapes are valid in the db, but can become invalid on
     reprojection. We buffer if needed.
@@ -1910,7 +2048,21 @@ def _get_shape(geometry: WKBElement, crs) -> Optional[Geometry]:
     if geometry is None:
         return None
 
-    shape = Geometry(to_shape(geometry), crs).to_crs("EPSG:4326", wrapdateline=True)
+    return _to_valid_wgs84_shape(geometry, crs)
+
+
+@cached(
+    LRUCache(maxsize=1_000),
+    # The EWKB includes the srid, so the crs doesn't need to be in the key.
+    key=lambda geometry, crs: hashkey(_utils.geometry_digest(geometry.data)),
+    lock=Lock(),
+)
+def _to_valid_wgs84_shape(geometry: WKBElement, crs: CRS) -> Geometry:
+    """
+    Repeated footprints are only loaded and validated once, across our searches
+    and endpoints. (They're keyed by content, so an updated footprint is redone.)
+    """
+    shape = Geometry(to_shape(geometry), crs).to_crs(WGS84_CRS, wrapdateline=True)
 
     if not shape.is_valid:
         newshape = shape.buffer(0)
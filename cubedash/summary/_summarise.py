@@ -9,8 +9,7 @@ from cachetools.func import lru_cache
 from datacube.model import Range
 from dateutil import tz
 from geoalchemy2 import Geometry, shape as geo_shape
-from sqlalchemy import and_, func, or_, select
-from sqlalchemy.dialects.postgresql import TSTZRANGE
+from sqlalchemy import and_, func, or_, select, tuple_
 from sqlalchemy.sql import ColumnElement
 
 from cubedash import _utils
@@ -135,43 +134,31 @@ class Summariser:
         )
         region_counts = Counter()
         if has_data:
-            day_counts.update(
-                Counter(
-                    {
-                        day.date(): count
-                        for day, count in self._engine.execute(
-                            select(
-                                [
-                                    func.date_trunc(
-                                        "day",
-                                        DATASET_SPATIAL.c.center_time.op(
-                                            "AT TIME ZONE"
-                                        )(self.grouping_time_zone),
-                                    ).label("day"),
-                                    func.count(),
-                                ]
-                            )
-                            .where(where_clause)
-                            .group_by("day")
-                        )
-                    }
-                )
-            )
-            region_counts = Counter(
-                {
-                    item: count
-                    for item, count in self._engine.execute(
-                        select(
-                            [
-                                DATASET_SPATIAL.c.region_code.label("region_code"),
-                                func.count(),
-                            ]
-                        )
-                        .where(where_clause)
-                        .group_by("region_code")
-                    )
-                }
+            # Count both per-day and per-region in a single scan of the datasets.
+            day = func.date_trunc(
+                "day",
+                DATASET_SPATIAL.c.center_time.op("AT TIME ZONE")(
+                    self.grouping_time_zone
+                ),
             )
+            region_code = DATASET_SPATIAL.c.region_code
+            for is_region_row, day_value, region_value, count in self._engine.execute(
+                select(
+                    [
+                        # Non-zero when the day isn't grouped: ie, a region count.
+                        func.grouping(day).label("is_region_row"),
+                        day.label("day"),
+                        region_code.label("region_code"),
+                        func.count(),
+                    ]
+                )
+                .where(where_clause)
+                .group_by(func.grouping_sets(tuple_(day), tuple_(region_code)))
+            ):
+                if is_region_row:
+                    region_counts[region_value] = count
+                else:
+                    day_counts[day_value.date()] = count
 
         if product_refresh_time is None:
             raise RuntimeError(
@@ -213,9 +200,9 @@ class Summariser:
         begin_time = self._with_default_tz(time.begin)
         end_time = self._with_default_tz(time.end)
         where_clause = and_(
-            func.tstzrange(begin_time, end_time, "[]", type_=TSTZRANGE).contains(
-                DATASET_SPATIAL.c.center_time
-            ),
+            # Inclusive comparison (not a tstzrange containment) so that the
+            # (dataset_type_ref, center_time) index can be range-scanned.
+            DATASET_SPATIAL.c.center_time.between(begin_time, end_time),
             DATASET_SPATIAL.c.dataset_type_ref
             == _scalar_subquery(
                 select([ODC_DATASET_TYPE.c.id]).where(
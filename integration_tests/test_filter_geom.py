@@ -6,9 +6,13 @@ from pathlib import Path
 
 import pytest
 import shapely.wkt
-from shapely.geometry import shape
+from shapely.geometry import box, shape
 
-from cubedash.summary._model import _filter_geom, _polygon_chain
+from cubedash.summary._model import (
+    _create_unified_footprint,
+    _filter_geom,
+    _polygon_chain,
+)
 
 TEST_DATA_DIR = Path(__file__).parent / "data"
 
@@ -39,6 +43,19 @@ def test_filter_geom():
     assert _filter_geom([geom])
 
 
+def test_unified_footprint_with_repeated_geometries():
+    """
+    Periods with identical footprints (eg. the same tiles every month) should union
+    to the same result as the distinct footprints.
+    """
+    tile_a, tile_b = box(0, 0, 1, 1), box(1, 0, 2, 1)
+    periods = [ValidGeometries(tile_a), ValidGeometries(tile_b)] * 12
+
+    union = _create_unified_footprint(periods, footprint_tolerance=None)
+    assert union.equals(box(0, 0, 2, 1))
+    assert _create_unified_footprint([], footprint_tolerance=None) is None
+
+
 @pytest.mark.skip("Skipping because the newer Shapely is handling geometry better.")
 def test_nested_exception(testing_polygon):
     """
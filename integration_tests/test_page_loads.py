@@ -9,15 +9,20 @@ from textwrap import indent
 import pytest
 from click.testing import Result
 from datacube.index import Index
+from datacube.utils import parse_time
 from dateutil import tz
 from flask import Response
 from flask.testing import FlaskClient
+from geoalchemy2.shape import from_shape, to_shape
 from requests_html import HTML, Element
 from ruamel.yaml import YAML, YAMLError
+from shapely.geometry import Polygon, shape
+from sqlalchemy import func, select
 
 import cubedash
-from cubedash import _model, _monitoring
+from cubedash import _model, _monitoring, _utils
 from cubedash.summary import SummaryStore, _extents, show
+from cubedash.summary._schema import DATASET_SPATIAL
 from integration_tests.asserts import (
     check_area,
     check_dataset_count,
@@ -432,6 +437,88 @@ def test_api_returns_tiles_as_geojson(client: FlaskClient):
     assert len(geojson["features"]) == 4, "Unepected albers polygon count"
 
 
+def test_api_features_match_dataset_items(client: FlaskClient):
+    """
+    The Postgis-built api Features should match the DatasetItem ones, including
+    for a footprint that's invalid once reprojected (and so cleaned by both).
+    """
+    store = _model.STORE
+    engine = _utils.alchemy_engine(store.index)
+    product_name = "ls8_nbart_albers"
+
+    [dataset] = store.index.datasets.search(product=product_name, limit=1)
+    original_footprint = engine.execute(
+        select([DATASET_SPATIAL.c.footprint]).where(DATASET_SPATIAL.c.id == dataset.id)
+    ).scalar()
+
+    # A zero-width spike into the footprint: invalid, but with an unchanged area.
+    x0, y0, x1, y1 = to_shape(original_footprint).bounds
+    xm, ym = (x0 + x1) / 2, (y0 + y1) / 2
+    spiked = Polygon(
+        [(x0, y0), (x1, y0), (x1, y1), (xm, y1), (xm, ym), (xm, y1), (x0, y1)]
+    )
+
+    def _set_footprint(footprint):
+        engine.execute(
+            DATASET_SPATIAL.update()
+            .where(DATASET_SPATIAL.c.id == dataset.id)
+            .values(footprint=footprint)
+        )
+
+    _set_footprint(from_shape(spiked, srid=original_footprint.srid))
+    try:
+        assert not engine.execute(
+            select(
+                [func.ST_IsValid(func.ST_Transform(DATASET_SPATIAL.c.footprint, 4326))]
+            ).where(DATASET_SPATIAL.c.id == dataset.id)
+        ).scalar(), "Test footprint should be invalid in wgs84"
+
+        expected_features = {
+            f["id"]: f
+            for f in json.loads(
+                _utils.to_json_bytes(
+                    [
+                        item.as_geojson()
+                        for item in store.search_items(product_names=[product_name])
+                    ]
+                )
+            )
+        }
+        features = {
+            f["id"]: f
+            for f in (
+                json.loads(f)
+                for f in store.search_items_geojson(product_names=[product_name])
+            )
+        }
+    finally:
+        _set_footprint(original_footprint)
+
+    assert len(expected_features) == 7
+    assert features.keys() == expected_features.keys()
+
+    for id_, expected in expected_features.items():
+        feature = features[id_]
+        assert feature["type"] == expected["type"]
+        assert feature["bbox"] == pytest.approx(expected["bbox"])
+
+        # Postgres and Python format their timestamps a little differently.
+        properties, expected_properties = feature["properties"], expected["properties"]
+        assert properties.keys() == expected_properties.keys()
+        for key, expected_value in expected_properties.items():
+            if key in ("datetime", "odc:processing_datetime"):
+                assert parse_time(properties[key]) == parse_time(expected_value)
+            else:
+                assert properties[key] == expected_value
+
+        geometry, expected_geometry = (
+            shape(feature["geometry"]),
+            shape(expected["geometry"]),
+        )
+        assert geometry.is_valid
+        assert geometry.symmetric_difference(expected_geometry).area < 1e-9, id_
+
+
 def test_api_returns_high_tide_comp_regions(client: FlaskClient):
     """
     High tide doesn't have anything we can use as regions.
@@ -453,6 +540,44 @@ def test_api_returns_scene_regions(client: FlaskClient):
     assert len(geojson["features"]) == 7, "Unexpected scene region count"
 
 
+def test_api_regions_are_conditional(client: FlaskClient):
+    """
+    A browser re-requesting unchanged regions should get an empty "not modified".
+    """
+    rv: Response = client.get("/api/regions/ls8_level1_scene")
+    assert rv.status_code == 200
+    etag = rv.headers["ETag"]
+
+    assert rv.cache_control.no_cache
+
+    rv: Response = client.get(
+        "/api/regions/ls8_level1_scene", headers={"If-None-Match": etag}
+    )
+    assert rv.status_code == 304
+    assert not rv.data
+
+
+def test_api_footprint_is_conditional(client: FlaskClient):
+    """
+    A browser re-requesting an unchanged footprint should get an empty "not modified".
+    """
+    rv: Response = client.get("/api/footprint/ls7_nbar_scene")
+    assert rv.status_code == 200
+    etag = rv.headers["ETag"]
+
+    rv: Response = client.get(
+        "/api/footprint/ls7_nbar_scene", headers={"If-None-Match": etag}
+    )
+    assert rv.status_code == 304
+    assert not rv.data
+
+    # A different period is a different body, so shouldn't match.
+    rv: Response = client.get(
+        "/api/footprint/ls7_nbar_scene/2017", headers={"If-None-Match": etag}
+    )
+    assert rv.status_code == 200
+
+
 def test_region_page(client: FlaskClient):
     """
     Load a list of scenes for a given region.
@@ -503,6 +628,69 @@ def test_search_page(client: FlaskClient):
     assert len(search_results) == 3
 
 
+def test_search_returns_earliest_datasets(client: FlaskClient):
+    """
+    A limited search should return the earliest datasets (sorted), not an
+    arbitrary subset.
+    """
+    all_datasets = sorted(
+        _model.STORE.index.datasets.search(product="ls8_nbar_scene"),
+        key=lambda d: d.center_time,
+    )
+    assert len(all_datasets) == 7
+
+    product = _model.STORE.get_dataset_type("ls8_nbar_scene")
+    datasets = list(_model.STORE.find_datasets(product, {}, limit=3))
+    assert [d.id for d in datasets] == [d.id for d in all_datasets[:3]]
+
+
+def test_updated_footprint_is_returned(client: FlaskClient):
+    """
+    Returned shapes are cached, but a changed footprint mustn't be served stale.
+    """
+    store = _model.STORE
+    [dataset] = store.index.datasets.search(product="ls7_nbart_albers", limit=1)
+    original = store.get_item(dataset.id, full_dataset=False).geometry.geom
+
+    engine = _utils.alchemy_engine(store.index)
+
+    def _shift_footprint(metres: float):
+        engine.execute(
+            DATASET_SPATIAL.update()
+            .where(DATASET_SPATIAL.c.id == dataset.id)
+            .values(footprint=func.ST_Translate(DATASET_SPATIAL.c.footprint, metres, 0))
+        )
+
+    _shift_footprint(10_000)
+    try:
+        moved = store.get_item(dataset.id, full_dataset=False).geometry.geom
+        assert not moved.equals(original)
+        assert moved.centroid.x > original.centroid.x
+    finally:
+        _shift_footprint(-10_000)
+
+    restored = store.get_item(dataset.id, full_dataset=False).geometry.geom
+    assert restored.equals_exact(original, tolerance=1e-6)
+
+
+def test_search_page_as_json(client: FlaskClient):
+    """
+    Datasets' search fields include Range values, which must serialise.
+    """
+    rv: Response = client.get(
+        "/products/ls7_nbar_scene/datasets", headers={"Accept": "application/json"}
+    )
+    assert rv.status_code == 200, rv.data
+    datasets = rv.json["datasets"]
+    assert datasets
+
+    time_range = datasets[0]["fields"]["time"]
+    assert isinstance(time_range, list)
+    assert len(time_range) == 2
+    begin, end = time_range
+    assert begin <= end
+
+
 def test_search_time_completion(client: FlaskClient):
     # They only specified a begin time, so the end time should be filled in with the product extent.
     html = get_html(client, "/datasets/ls7_nbar_scene?time-begin=1999-05-28")
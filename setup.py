@@ -86,6 +86,7 @@ setup(
         "geographiclib",
         "jinja2",
         "markupsafe",
+        "numpy",
         "pyorbital",
         "pyproj",
         "python-dateutil",